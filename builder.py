@@ -14,6 +14,7 @@ from core import DatapackType, DATAPACK_CONFIGS
 from core.builder.processors import FileParser, ItemGrouper, DatapackBuilder
 from core.builder.ui import display_namespace_selection
 from core.constants import DefaultDirs, FilePatterns
+from core.utils.file import find_txt_files
 from core.utils.path import validate_directory
 from core.utils.logging import log_error, log_warning
 
@@ -129,7 +130,7 @@ Examples:
         print("Scan mode: Searching for txt files in project root...")
         
         # Find txt files in project root
-        project_root_txt_files = list(project_root.glob("*.txt"))
+        project_root_txt_files = find_txt_files(project_root)
         
         if not project_root_txt_files:
             log_error("No txt files found in project root directory.")
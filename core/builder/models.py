@@ -25,9 +25,9 @@ TYPE_NAME_MAP: Dict[DatapackType, str] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatapackConfig:
-    """Configuration for a datapack type."""
+    """Configuration for a datapack type (shared, read-only)."""
     type: DatapackType
     scan_dir: Path  # Default scan directory
     match_key: str  # JSON key for match items/blocks/fluids
@@ -36,7 +36,7 @@ class DatapackConfig:
     is_fluid: bool  # Whether to use fluid normalization
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModPair:
     """Represents a pair of mods with overlapping base names."""
     mod1: str  # namespace
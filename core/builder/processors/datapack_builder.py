@@ -5,12 +5,16 @@ This module provides functionality to create Minecraft datapacks for the
 One Enough mod series (One Enough Item, One Enough Block, One Enough Fluid).
 """
 
-import json
 from pathlib import Path
 from typing import Set
 
 from core.builder.models import DatapackConfig
 from core.builder.processors.item_grouper import ItemGrouper
+from core.utils.json import dumps_json
+
+
+# Datapack format written to pack.mcmeta (Minecraft 1.20.1)
+PACK_FORMAT = 15
 
 
 class DatapackBuilder:
@@ -51,17 +55,17 @@ class DatapackBuilder:
         if not items:
             raise ValueError("Cannot create datapack from empty items set")
         
+        # Group items by base name
+        by_base_name = self.item_grouper.group_by_base_name(items, is_fluid=config.is_fluid)
+        
         # Validate result_namespace exists in items
-        from core.utils.item import extract_namespace
-        namespaces = {extract_namespace(item) for item in items}
-        namespaces.discard(None)  # Remove None values from invalid items
+        # (the grouping already holds every valid namespace, so no second pass over items)
+        namespaces = set().union(*by_base_name.values())
         if result_namespace not in namespaces:
             raise ValueError(
                 f"Result namespace '{result_namespace}' not found in items. "
                 f"Available namespaces: {', '.join(sorted(namespaces))}"
             )
-        # Group items by base name
-        by_base_name = self.item_grouper.group_by_base_name(items, is_fluid=config.is_fluid)
         
         # Create datapack structure
         datapack_dir = output_dir / datapack_name
@@ -75,6 +79,11 @@ class DatapackBuilder:
         replacements = []
         matched_count = 0
         unmatched_count = 0
+        # Loop-invariant lookups, resolved once rather than per base name
+        match_key = config.match_key
+        result_key = config.result_key
+        is_fluid = config.is_fluid
+        get_result_item = self.item_grouper.get_result_item
         
         for base_name, namespace_items in sorted(by_base_name.items()):
             # Check if result namespace has an item with this base name
@@ -86,18 +95,20 @@ class DatapackBuilder:
                 continue
             
             # Get the result item (prefer non-flowing for fluids)
-            result_item = self.item_grouper.get_result_item(result_items, is_fluid=config.is_fluid)
+            result_item = get_result_item(result_items, is_fluid=is_fluid)
             
             # Collect all items from other namespaces with this base name
-            match_items = []
-            for namespace, namespace_item_set in namespace_items.items():
-                if namespace != result_namespace:
-                    match_items.extend(sorted(namespace_item_set))
+            match_items = [
+                item
+                for namespace, namespace_item_set in namespace_items.items()
+                if namespace != result_namespace
+                for item in sorted(namespace_item_set)
+            ]
             
             if match_items:
                 replacements.append({
-                    config.match_key: match_items,
-                    config.result_key: result_item
+                    match_key: match_items,
+                    result_key: result_item
                 })
                 matched_count += len(match_items)
         
@@ -111,7 +122,7 @@ class DatapackBuilder:
         replacement_file = replacements_dir / f'{result_namespace}.json'
         try:
             with open(replacement_file, 'w', encoding='utf-8') as f:
-                json.dump(replacements, f, indent=2)
+                f.write(dumps_json(replacements))
         except (IOError, OSError) as e:
             raise OSError(f"Failed to write replacement file {replacement_file}: {e}") from e
         
@@ -119,12 +130,12 @@ class DatapackBuilder:
         pack_mcmeta = datapack_dir / 'pack.mcmeta'
         try:
             with open(pack_mcmeta, 'w', encoding='utf-8') as f:
-                json.dump({
+                f.write(dumps_json({
                     "pack": {
-                        "pack_format": 15,
+                        "pack_format": PACK_FORMAT,
                         "description": f"{config.description} replacements - {datapack_name}"
                     }
-                }, f, indent=2)
+                }))
         except (IOError, OSError) as e:
             raise OSError(f"Failed to write pack.mcmeta {pack_mcmeta}: {e}") from e
         
@@ -6,6 +6,7 @@ by namespace or by base name (the part after the colon), with special handling
 for fluid normalization (flowing_* variants).
 """
 
+import sys
 from collections import defaultdict
 from typing import Set, Dict
 from core.utils.item import extract_namespace, get_base_name
@@ -51,7 +52,7 @@ class ItemGrouper:
             Base name (id part) of the item
         
         Note:
-            This method delegates to core.common.item_utils.get_base_name() for consistency.
+            This method delegates to core.utils.item.get_base_name() for consistency.
         """
         return get_base_name(item_id, is_fluid)
     
@@ -69,15 +70,15 @@ class ItemGrouper:
             Format: {base_name: {namespace: {items}}}
         """
         by_base_name = defaultdict(lambda: defaultdict(set))
-        
         for item in items:
             if ':' not in item:
                 continue
             
-            base_name = ItemGrouper.get_base_name(item, is_fluid)
+            base_name = get_base_name(item, is_fluid)
             namespace = extract_namespace(item)
             if namespace:  # Only add if namespace is valid
-                by_base_name[base_name][namespace].add(item)
+                # Intern: the same namespace key is repeated under every base name
+                by_base_name[base_name][sys.intern(namespace)].add(item)
         
         return by_base_name
     
@@ -101,13 +102,12 @@ class ItemGrouper:
         if not items:
             raise ValueError("Cannot get result item from empty set")
         
-        sorted_items = sorted(items)
-        
+        # Only the lexicographically first item is needed, so min() instead of a full sort
         if is_fluid:
             # Prefer non-flowing fluids
-            non_flowing = [item for item in sorted_items if not item.split(':')[-1].startswith('flowing_')]
+            non_flowing = [item for item in items if not item.rpartition(':')[2].startswith('flowing_')]
             if non_flowing:
-                return non_flowing[0]
+                return min(non_flowing)
         
-        return sorted_items[0]
+        return min(items)
 
@@ -12,23 +12,22 @@ from typing import List, Optional
 
 from core.builder.models import DatapackType, ModPair
 from core.builder.processors.file_parser import FileParser
-from core.builder.processors.item_grouper import ItemGrouper
+from core.utils.file import find_txt_files
+from core.utils.item import get_base_name
 from core.utils.logging import log_warning
 
 
 class PairScanner:
     """Scanner for finding mod pairs with overlapping base names."""
     
-    def __init__(self, file_parser: FileParser, item_grouper: ItemGrouper):
+    def __init__(self, file_parser: FileParser):
         """
         Initialize PairScanner.
         
         Args:
             file_parser: FileParser instance for reading mod files
-            item_grouper: ItemGrouper instance for calculating base names
         """
         self.file_parser = file_parser
-        self.item_grouper = item_grouper
     
     def scan_installed_mods(
         self,
@@ -67,8 +66,7 @@ class PairScanner:
         
         # Load all mod files
         mod_data = {}
-        from core.constants import FilePatterns
-        txt_files = list(scan_dir.glob(f"*{FilePatterns.TXT_EXTENSION}"))
+        txt_files = find_txt_files(scan_dir)
         if not txt_files:
             log_warning(f"No .txt files found in scan directory: {scan_dir}")
             return []
@@ -86,31 +84,25 @@ class PairScanner:
             return []
         
         # Calculate base name overlap for each pair
-        pairs = []
         is_fluid = DATAPACK_CONFIGS[datapack_type].is_fluid
+        # Compute each mod's base names once; every mod takes part in len(mod_data) - 1 pairs
+        base_names = {
+            mod: {get_base_name(item, is_fluid) for item in items}
+            for mod, items in mod_data.items()
+        }
         
-        for mod1, mod2 in itertools.combinations(mod_data.keys(), 2):
-            # Get base names for each mod
-            mod1_base_names = {
-                self.item_grouper.get_base_name(item, is_fluid)
-                for item in mod_data[mod1]
-            }
-            mod2_base_names = {
-                self.item_grouper.get_base_name(item, is_fluid)
-                for item in mod_data[mod2]
-            }
-            
-            # Calculate overlap
-            overlap = mod1_base_names & mod2_base_names
-            
-            if len(overlap) >= min_matches:
-                pairs.append(ModPair(
-                    mod1=mod1,
-                    mod2=mod2,
-                    match_count=len(overlap),
-                    mod1_items=mod_data[mod1],
-                    mod2_items=mod_data[mod2]
-                ))
+        # Single pass over all pairs; the overlap size is computed once per pair
+        pairs = [
+            ModPair(
+                mod1=mod1,
+                mod2=mod2,
+                match_count=match_count,
+                mod1_items=mod_data[mod1],
+                mod2_items=mod_data[mod2]
+            )
+            for mod1, mod2 in itertools.combinations(mod_data.keys(), 2)
+            if (match_count := len(base_names[mod1] & base_names[mod2])) >= min_matches
+        ]
         
         # Sort by match count (descending)
         pairs.sort(key=lambda p: p.match_count, reverse=True)
@@ -120,8 +112,7 @@ class PairScanner:
             import shutil
             mods_in_pairs = set()
             for pair in pairs:
-                mods_in_pairs.add(pair.mod1)
-                mods_in_pairs.add(pair.mod2)
+                mods_in_pairs.update((pair.mod1, pair.mod2))
             
             for mod_name in mods_in_pairs:
                 source_file = scan_dir / f"{mod_name}.txt"
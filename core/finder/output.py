@@ -9,6 +9,7 @@ from typing import List
 
 from core.builder.models import ModPair, DatapackType, TYPE_NAME_MAP
 from core.constants import FilePatterns, DisplayConstants
+from core.utils.file import find_txt_files
 from core.utils.format import format_separator, format_subseparator
 from core.utils.logging import log_warning
 
@@ -36,7 +37,7 @@ def copy_scan_files(
     
     # Copy all files from scan_dir to type_dir
     copied_count = 0
-    for source_file in scan_dir.glob("*.txt"):
+    for source_file in find_txt_files(scan_dir):
         dest_file = type_dir / source_file.name
         try:
             shutil.copy2(source_file, dest_file)
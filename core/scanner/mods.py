@@ -8,59 +8,80 @@ import os
 import json
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from core.utils.jar import open_jar_safe, extract_namespaces_from_jar
+from core.utils.jar import open_jar_safe, extract_namespaces_from_names
 from core.utils.json import load_json_from_jar
 
 logger = logging.getLogger(__name__)
 
+# Common non-mod namespaces skipped when deriving a mod ID from data/
+COMMON_NAMESPACES = frozenset({'minecraft', 'forge', 'c'})
 
-def extract_mod_id_from_jar(jar_path):
-    """Extract mod ID from a JAR file by reading mods.toml, fabric.mod.json, or META-INF."""
+# modId field in (neoforge.)mods.toml, compiled once instead of per JAR.
+# Bytes pattern: matched against the raw file so only the ID is decoded.
+MOD_ID_PATTERN = re.compile(rb'modId\s*=\s*["\']([^"\']+)["\']')
+
+
+def _extract_mod_id(jar, file_list, jar_path):
+    """Extract mod ID from an open JAR given its entry names (see extract_mod_id_from_jar)."""
     mod_id = None
-    mod_name = os.path.basename(jar_path)
+    # ZipFile's own name -> ZipInfo dict; file_list keeps entry order for the fallback
+    entries = jar.NameToInfo
     
-    with open_jar_safe(jar_path) as jar:
-        file_list = jar.namelist()
-        
-        # Try NeoForge/Forge: META-INF/neoforge.mods.toml or META-INF/mods.toml
-        for toml_path in ['META-INF/neoforge.mods.toml', 'META-INF/mods.toml']:
-            if toml_path in file_list:
-                try:
-                    with jar.open(toml_path) as f:
-                        content = f.read().decode('utf-8')
-                        # Simple TOML parsing for modid field
-                        match = re.search(r'modId\s*=\s*["\']([^"\']+)["\']', content)
-                        if match:
-                            mod_id = match.group(1)
-                            break
-                except (UnicodeDecodeError, KeyError) as e:
-                    logger.debug(f"Failed to parse TOML {toml_path} from {jar_path}: {e}")
-        
-        # Try Fabric: fabric.mod.json
-        if not mod_id and 'fabric.mod.json' in file_list:
-            data = load_json_from_jar(jar, 'fabric.mod.json')
-            if data and 'id' in data:
-                mod_id = data['id']
+    # Try NeoForge/Forge: META-INF/neoforge.mods.toml or META-INF/mods.toml
+    for toml_path in ['META-INF/neoforge.mods.toml', 'META-INF/mods.toml']:
+        if toml_path in entries:
+            try:
+                content = jar.read(toml_path)
+                # Simple TOML parsing for modid field
+                match = MOD_ID_PATTERN.search(content)
+                if match:
+                    mod_id = match.group(1).decode('utf-8')
+                    break
+            except (UnicodeDecodeError, KeyError) as e:
+                logger.debug("Failed to parse TOML %s from %s: %s", toml_path, jar_path, e)
+    
+    # Try Fabric: fabric.mod.json
+    if not mod_id and 'fabric.mod.json' in entries:
+        data = load_json_from_jar(jar, 'fabric.mod.json')
+        if data and 'id' in data:
+            mod_id = data['id']
+    
+    # Fallback: derive from JAR name or first namespace found in data/
+    if not mod_id:
+        # Try to find first namespace in data/ directory
+        for file_path in file_list:
+            if file_path.startswith('data/') and '/' in file_path[5:]:
+                parts = file_path.split('/', 2)  # Only the namespace segment is needed
+                if len(parts) >= 2:
+                    potential_namespace = parts[1]
+                    # Skip common non-mod namespaces
+                    if potential_namespace not in COMMON_NAMESPACES:
+                        mod_id = potential_namespace
+                        break
         
-        # Fallback: derive from JAR name or first namespace found in data/
+        # Last resort: use filename without extension
+        # (the name is only derived here, not for every JAR)
         if not mod_id:
-            # Try to find first namespace in data/ directory
-            for file_path in file_list:
-                if file_path.startswith('data/') and '/' in file_path[5:]:
-                    parts = file_path.split('/')
-                    if len(parts) >= 2:
-                        potential_namespace = parts[1]
-                        # Skip common non-mod namespaces
-                        if potential_namespace not in ['minecraft', 'forge', 'c']:
-                            mod_id = potential_namespace
-                            break
-            
-            # Last resort: use filename without extension
-            if not mod_id:
-                mod_id = os.path.splitext(mod_name)[0]
+            mod_name = os.path.basename(jar_path)
+            mod_id = os.path.splitext(mod_name)[0] or mod_name
     
-    return mod_id or mod_name
+    return mod_id
+
+
+def extract_mod_id_from_jar(jar_path):
+    """Extract mod ID from a JAR file by reading mods.toml, fabric.mod.json, or META-INF."""
+    with open_jar_safe(jar_path) as jar:
+        return _extract_mod_id(jar, jar.namelist(), jar_path)
+
+
+def _discover_jar(jar_path):
+    """Read the mod ID and data/ namespaces of a single JAR, opening it only once."""
+    with open_jar_safe(jar_path) as jar:
+        file_list = jar.namelist()
+        mod_id = _extract_mod_id(jar, file_list, jar_path)
+    return mod_id, extract_namespaces_from_names(file_list)
 
 
 def discover_mods_and_namespaces(mods_dir='mods'):
@@ -88,12 +109,16 @@ def discover_mods_and_namespaces(mods_dir='mods'):
     print(f"Found {len(jar_files)} JAR file(s) to scan...")
     print_subseparator()
     
-    for jar_file in jar_files:
-        mod_id = extract_mod_id_from_jar(jar_file)
+    # JARs are independent and zip reads are I/O-bound, so read them concurrently.
+    # map() yields results in jar_files order, keeping the namespace mapping below stable.
+    with ThreadPoolExecutor() as executor:
+        jar_results = list(executor.map(_discover_jar, jar_files))
+    
+    listing = []  # Per-JAR lines, printed in one write once discovery is done
+    for jar_file, (mod_id, mod_namespaces) in zip(jar_files, jar_results):
         mods[mod_id] = jar_file
         
         # Discover namespaces from data/ directory and map them to this mod
-        mod_namespaces = extract_namespaces_from_jar(jar_file)
         namespaces.update(mod_namespaces)
         
         # Map namespaces to mod_id (primary namespace is usually mod_id)
@@ -104,8 +129,9 @@ def discover_mods_and_namespaces(mods_dir='mods'):
         if mod_id not in namespace_to_mod:
             namespace_to_mod[mod_id] = mod_id
         
-        print(f"  {mod_id:40s}: {jar_file.name}")
+        listing.append(f"  {mod_id:40s}: {jar_file.name}")
     
+    print('\n'.join(listing))
     print_subseparator()
     print(f"Total mods discovered: {len(mods)}")
     print(f"Total namespaces discovered: {len(namespaces)}")
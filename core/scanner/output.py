@@ -4,10 +4,12 @@ Output Management
 Saves all scan outputs to the scan_output directory.
 """
 
+import heapq
 import logging
 from pathlib import Path
 from collections import defaultdict
 from core.utils.item import extract_namespace, is_tag_reference, sanitize_filename
+from core.utils.file import find_txt_files, write_sorted_lines
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +42,16 @@ def _collect_referenced_items_by_namespace(all_tags, recipe_data):
     return all_referenced_items_by_ns
 
 
+def _write_sorted_items(f, items, indent):
+    """Write items to a file in sorted order, one indented line each, in a single call."""
+    f.writelines([f"{indent}{item}\n" for item in sorted(items)])
+
+
 def _write_items_section(f, items, item_type):
     """Write a section of items to a file."""
     if items:
         f.write(f"{item_type} ({len(items)}):\n")
-        for item in sorted(items):
-            f.write(f"  {item}\n")
+        _write_sorted_items(f, items, "  ")
         f.write("\n")
 
 
@@ -73,11 +79,22 @@ def save_mods(output_path, mods, namespace_to_mod_map, blocks_by_ns, items_by_ns
     installed_mods_dir = output_path / 'mods' / 'installed'
     installed_mods_dir.mkdir(parents=True, exist_ok=True)
     
+    # Tag files (installed and not installed) listed once and shared by every mod below
     tag_to_items_dir = output_path / 'tag_to_items'
+    tag_files = [
+        (tag_file.stem, tag_file)
+        for subdir in ('installed', 'not_installed')
+        for tag_file in find_txt_files(tag_to_items_dir / subdir)
+    ]
+    
+    # Group namespaces by mod in one pass instead of rescanning the map for every mod
+    namespaces_by_mod = defaultdict(set)
+    for ns, m_id in namespace_to_mod_map.items():
+        namespaces_by_mod[m_id].add(ns)
     
     for mod_id in sorted(mods.keys()):
         # Find all namespaces for this mod
-        mod_namespaces = {ns for ns, m_id in namespace_to_mod_map.items() if m_id == mod_id}
+        mod_namespaces = set(namespaces_by_mod.get(mod_id, ()))
         if mod_id not in mod_namespaces:
             mod_namespaces.add(mod_id)  # Add mod_id itself as namespace
         
@@ -126,8 +143,7 @@ def save_mods(output_path, mods, namespace_to_mod_map, blocks_by_ns, items_by_ns
         # Tag files are named like: namespace_tag_name.txt (sanitized)
         for ns in mod_namespaces:
             ns_prefix = ns.replace(':', '_') + '_'
-            for tag_file in tag_to_items_dir.glob('*.txt'):
-                tag_name = tag_file.stem
+            for tag_name, tag_file in tag_files:
                 # Check if this tag belongs to this namespace (starts with namespace_)
                 if tag_name.startswith(ns_prefix):
                     # Read items from this tag file
@@ -193,36 +209,30 @@ def save_mods(output_path, mods, namespace_to_mod_map, blocks_by_ns, items_by_ns
                         f.write("Blocks (from secondary namespaces):\n")
                         if secondary_blocks_installed:
                             f.write("  Installed:\n")
-                            for item in sorted(secondary_blocks_installed):
-                                f.write(f"    {item}\n")
+                            _write_sorted_items(f, secondary_blocks_installed, "    ")
                         if secondary_blocks_not_installed:
                             f.write("  Not Installed:\n")
-                            for item in sorted(secondary_blocks_not_installed):
-                                f.write(f"    {item}\n")
+                            _write_sorted_items(f, secondary_blocks_not_installed, "    ")
                         f.write("\n")
                     
                     if secondary_items_installed or secondary_items_not_installed:
                         f.write("Items (from secondary namespaces):\n")
                         if secondary_items_installed:
                             f.write("  Installed:\n")
-                            for item in sorted(secondary_items_installed):
-                                f.write(f"    {item}\n")
+                            _write_sorted_items(f, secondary_items_installed, "    ")
                         if secondary_items_not_installed:
                             f.write("  Not Installed:\n")
-                            for item in sorted(secondary_items_not_installed):
-                                f.write(f"    {item}\n")
+                            _write_sorted_items(f, secondary_items_not_installed, "    ")
                         f.write("\n")
                     
                     if secondary_fluids_installed or secondary_fluids_not_installed:
                         f.write("Fluids (from secondary namespaces):\n")
                         if secondary_fluids_installed:
                             f.write("  Installed:\n")
-                            for item in sorted(secondary_fluids_installed):
-                                f.write(f"    {item}\n")
+                            _write_sorted_items(f, secondary_fluids_installed, "    ")
                         if secondary_fluids_not_installed:
                             f.write("  Not Installed:\n")
-                            for item in sorted(secondary_fluids_not_installed):
-                                f.write(f"    {item}\n")
+                            _write_sorted_items(f, secondary_fluids_not_installed, "    ")
                         f.write("\n")
                 
                 # Write referenced items from tags/recipes
@@ -230,36 +240,30 @@ def save_mods(output_path, mods, namespace_to_mod_map, blocks_by_ns, items_by_ns
                     f.write("Blocks:\n")
                     if referenced_blocks_installed:
                         f.write("  Installed:\n")
-                        for item in sorted(referenced_blocks_installed):
-                            f.write(f"    {item}\n")
+                        _write_sorted_items(f, referenced_blocks_installed, "    ")
                     if referenced_blocks_not_installed:
                         f.write("  Not Installed:\n")
-                        for item in sorted(referenced_blocks_not_installed):
-                            f.write(f"    {item}\n")
+                        _write_sorted_items(f, referenced_blocks_not_installed, "    ")
                     f.write("\n")
                 
                 if referenced_items_installed or referenced_items_not_installed:
                     f.write("Items:\n")
                     if referenced_items_installed:
                         f.write("  Installed:\n")
-                        for item in sorted(referenced_items_installed):
-                            f.write(f"    {item}\n")
+                        _write_sorted_items(f, referenced_items_installed, "    ")
                     if referenced_items_not_installed:
                         f.write("  Not Installed:\n")
-                        for item in sorted(referenced_items_not_installed):
-                            f.write(f"    {item}\n")
+                        _write_sorted_items(f, referenced_items_not_installed, "    ")
                     f.write("\n")
                 
                 if referenced_fluids_installed or referenced_fluids_not_installed:
                     f.write("Fluids:\n")
                     if referenced_fluids_installed:
                         f.write("  Installed:\n")
-                        for item in sorted(referenced_fluids_installed):
-                            f.write(f"    {item}\n")
+                        _write_sorted_items(f, referenced_fluids_installed, "    ")
                     if referenced_fluids_not_installed:
                         f.write("  Not Installed:\n")
-                        for item in sorted(referenced_fluids_not_installed):
-                            f.write(f"    {item}\n")
+                        _write_sorted_items(f, referenced_fluids_not_installed, "    ")
                     f.write("\n")
 
 
@@ -295,9 +299,7 @@ def save_installed_mods_summary(output_path, mods, namespace_to_mod):
 
 def save_namespaces(output_path, namespaces):
     """Save namespaces list."""
-    with open(output_path / 'namespaces.txt', 'w', encoding='utf-8') as f:
-        for namespace in sorted(namespaces):
-            f.write(f"{namespace}\n")
+    write_sorted_lines(output_path / 'namespaces.txt', namespaces)
 
 
 def save_items_by_namespace(output_path, blocks_by_namespace, items_by_namespace, fluids_by_namespace,
@@ -347,9 +349,7 @@ def save_items_by_namespace(output_path, blocks_by_namespace, items_by_namespace
             target_dir = installed_dir if is_installed else not_installed_dir
             
             namespace_file = target_dir / f"{namespace}.txt"
-            with open(namespace_file, 'w', encoding='utf-8') as f:
-                for item in sorted(items_by_ns[namespace]):
-                    f.write(f"{item}\n")
+            write_sorted_lines(namespace_file, items_by_ns[namespace])
     
     # Save blocks by namespace
     blocks_namespace_dir = output_path / 'blocks'
@@ -400,12 +400,12 @@ def save_summary_from_disk(output_path, mods, namespaces, tag_metadata, recipe_m
             f.write(f"  {category:30s}: {count:5d} items\n")
         
         f.write("\nBlocks by Namespace (top 20):\n")
-        for namespace in sorted(blocks_by_ns.keys(), key=lambda x: len(blocks_by_ns[x]), reverse=True)[:20]:
+        for namespace in heapq.nlargest(20, blocks_by_ns.keys(), key=lambda x: len(blocks_by_ns[x])):
             count = len(blocks_by_ns[namespace])
             f.write(f"  {namespace:30s}: {count:5d} blocks\n")
         
         f.write("\nItems by Namespace (top 20):\n")
-        for namespace in sorted(items_by_ns.keys(), key=lambda x: len(items_by_ns[x]), reverse=True)[:20]:
+        for namespace in heapq.nlargest(20, items_by_ns.keys(), key=lambda x: len(items_by_ns[x])):
             count = len(items_by_ns[namespace])
             f.write(f"  {namespace:30s}: {count:5d} items\n")
         
@@ -9,11 +9,21 @@ import logging
 from pathlib import Path
 from collections import defaultdict
 from core.utils.item import extract_namespace
-from core.utils.file import read_item_lines
+from core.utils.file import read_item_lines, find_txt_files
 
 logger = logging.getLogger(__name__)
 
 
+def _add_items_from_files(files, target_dict, all_referenced_items_by_ns):
+    """Add every item in the given files to its namespace in both collections."""
+    for file_path in files:
+        for item in read_item_lines(file_path, skip_comments=True, skip_tag_refs=True):
+            namespace = extract_namespace(item)
+            if namespace:
+                target_dict[namespace].add(item)
+                all_referenced_items_by_ns[namespace].add(item)
+
+
 def collect_namespaces_from_disk(output_dir):
     """
     Read tag and recipe files from disk to build namespace collections.
@@ -33,41 +43,28 @@ def collect_namespaces_from_disk(output_dir):
     
     logger.info("Reading tags from disk to build namespace collections...")
     
+    # Tag type -> namespace collection it feeds (built once, not per directory)
+    target_dicts = {
+        'block': blocks_by_namespace,
+        'item': items_by_namespace,
+        'fluid': fluids_by_namespace
+    }
+    
     # Process tags by type
     for tag_type_dir in sorted(tags_dir.iterdir()):
         if not tag_type_dir.is_dir():
             continue
         
         tag_type = tag_type_dir.name
-        target_dict = {
-            'block': blocks_by_namespace,
-            'item': items_by_namespace,
-            'fluid': fluids_by_namespace
-        }.get(tag_type, items_by_namespace)  # Default to items if unknown type
+        target_dict = target_dicts.get(tag_type, items_by_namespace)  # Default to items if unknown type
         
-        for tag_file in sorted(tag_type_dir.glob('*.txt')):
-            for item in read_item_lines(tag_file, skip_comments=True, skip_tag_refs=True):
-                namespace = extract_namespace(item)
-                if namespace:
-                    target_dict[namespace].add(item)
-                    all_referenced_items_by_ns[namespace].add(item)
+        _add_items_from_files(sorted(find_txt_files(tag_type_dir)), target_dict, all_referenced_items_by_ns)
     
     logger.info("Reading recipes from disk to build namespace collections...")
     
     # Process recipe inputs/outputs
-    for inputs_file in sorted(item_inputs_dir.glob('*.txt')):
-        for item in read_item_lines(inputs_file, skip_comments=True, skip_tag_refs=True):
-            namespace = extract_namespace(item)
-            if namespace:
-                items_by_namespace[namespace].add(item)
-                all_referenced_items_by_ns[namespace].add(item)
-    
-    for outputs_file in sorted(item_outputs_dir.glob('*.txt')):
-        for item in read_item_lines(outputs_file, skip_comments=True, skip_tag_refs=True):
-            namespace = extract_namespace(item)
-            if namespace:
-                items_by_namespace[namespace].add(item)
-                all_referenced_items_by_ns[namespace].add(item)
+    _add_items_from_files(sorted(find_txt_files(item_inputs_dir)), items_by_namespace, all_referenced_items_by_ns)
+    _add_items_from_files(sorted(find_txt_files(item_outputs_dir)), items_by_namespace, all_referenced_items_by_ns)
     
     return blocks_by_namespace, items_by_namespace, fluids_by_namespace, all_referenced_items_by_ns
 
@@ -5,6 +5,7 @@ Scans recipes and writes them to disk immediately to reduce memory usage.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from collections import defaultdict
 from core.utils.jar import open_jar_safe
@@ -13,7 +14,7 @@ from core.utils.item import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
-# Batch size for processing mods to prevent too many open files
+# Batch size for processing mods; buffered output is written to disk after each batch
 BATCH_SIZE = 64
 
 
@@ -48,6 +49,28 @@ def extract_result(result):
     return None
 
 
+@lru_cache(maxsize=None)
+def _recipe_kind(recipe_type):
+    """
+    Classify a recipe type string into the input layout it uses.
+    
+    A modpack has only a few dozen distinct recipe types but thousands of
+    recipes, so the substring checks run once per type instead of per recipe.
+    
+    Returns:
+        'crafting', 'cooking', 'stonecutting', 'smithing', or None for unknown types
+    """
+    if 'crafting_shaped' in recipe_type or 'crafting_shapeless' in recipe_type:
+        return 'crafting'
+    if 'smelting' in recipe_type or 'blasting' in recipe_type or 'smoking' in recipe_type or 'campfire_cooking' in recipe_type:
+        return 'cooking'
+    if 'stonecutting' in recipe_type:
+        return 'stonecutting'
+    if 'smithing' in recipe_type:
+        return 'smithing'
+    return None
+
+
 def parse_recipe(recipe_data, recipe_id):
     """Parse a recipe JSON and extract information."""
     recipe_info = {
@@ -59,29 +82,30 @@ def parse_recipe(recipe_data, recipe_id):
     }
     
     recipe_type = recipe_data.get('type', '')
+    if not isinstance(recipe_type, str):
+        recipe_type = ''  # Malformed type: treat as untyped so it is never used as a key
     recipe_info['type'] = recipe_type
     recipe_info['category'] = recipe_data.get('category')
     
     # Extract inputs based on recipe type
-    if 'crafting_shaped' in recipe_type or 'crafting_shapeless' in recipe_type:
+    recipe_kind = _recipe_kind(recipe_type)
+    if recipe_kind == 'crafting':
         if 'key' in recipe_data:
-            for key, ingredient in recipe_data['key'].items():
-                recipe_info['inputs'].update(extract_item_from_ingredient(ingredient))
+            recipe_info['inputs'].update(*map(extract_item_from_ingredient, recipe_data['key'].values()))
         if 'ingredients' in recipe_data:
-            for ingredient in recipe_data['ingredients']:
-                recipe_info['inputs'].update(extract_item_from_ingredient(ingredient))
+            recipe_info['inputs'].update(*map(extract_item_from_ingredient, recipe_data['ingredients']))
         if 'ingredient' in recipe_data:
             recipe_info['inputs'].update(extract_item_from_ingredient(recipe_data['ingredient']))
     
-    elif 'smelting' in recipe_type or 'blasting' in recipe_type or 'smoking' in recipe_type or 'campfire_cooking' in recipe_type:
+    elif recipe_kind == 'cooking':
         if 'ingredient' in recipe_data:
             recipe_info['inputs'].update(extract_item_from_ingredient(recipe_data['ingredient']))
     
-    elif 'stonecutting' in recipe_type:
+    elif recipe_kind == 'stonecutting':
         if 'ingredient' in recipe_data:
             recipe_info['inputs'].update(extract_item_from_ingredient(recipe_data['ingredient']))
     
-    elif 'smithing' in recipe_type:
+    elif recipe_kind == 'smithing':
         if 'base' in recipe_data:
             recipe_info['inputs'].update(extract_item_from_ingredient(recipe_data['base']))
         if 'addition' in recipe_data:
@@ -101,14 +125,25 @@ def parse_recipe(recipe_data, recipe_id):
             recipe_info['outputs'].add(result)
     
     if 'results' in recipe_data:
-        for result in recipe_data['results']:
-            result_item = extract_result(result)
-            if result_item:
-                recipe_info['outputs'].add(result_item)
+        recipe_info['outputs'].update(filter(None, map(extract_result, recipe_data['results'])))
     
     return recipe_info
 
 
+def _append_pending_lines(pending, target_dir):
+    """
+    Append buffered lines to their per-type files and clear the buffer.
+    
+    Args:
+        pending: Dict of safe_type_name -> list of lines to append
+        target_dir: Directory holding the <safe_type_name>.txt files
+    """
+    for safe_type_name, lines in pending.items():
+        with open(target_dir / f"{safe_type_name}.txt", 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+    pending.clear()
+
+
 def discover_and_save_recipes_incremental(mods, output_dir):
     """
     Discover recipes incrementally and write to disk immediately.
@@ -125,11 +160,9 @@ def discover_and_save_recipes_incremental(mods, output_dir):
     item_inputs_dir = recipes_dir / 'item_inputs'
     item_outputs_dir = recipes_dir / 'item_outputs'
     
-    recipes_dir.mkdir(parents=True, exist_ok=True)
-    by_type_dir.mkdir(exist_ok=True)
-    by_mod_dir.mkdir(exist_ok=True)
-    item_inputs_dir.mkdir(exist_ok=True)
-    item_outputs_dir.mkdir(exist_ok=True)
+    # Creating the leaf directories with parents=True also creates recipes_dir
+    for leaf_dir in (by_type_dir, by_mod_dir, item_inputs_dir, item_outputs_dir):
+        leaf_dir.mkdir(parents=True, exist_ok=True)
     
     # Track minimal metadata
     recipe_types_found = set()
@@ -137,13 +170,15 @@ def discover_and_save_recipes_incremental(mods, output_dir):
     recipe_counts_by_mod = defaultdict(int)
     total_recipes = 0
     
-    # File handles for item inputs/outputs (append mode, cached for efficiency)
-    # Note: Recipe types are limited, so we don't need a cache limit here
-    item_inputs_files = {}  # recipe_type -> file handle
-    item_outputs_files = {}  # recipe_type -> file handle
-    by_type_files = {}  # recipe_type -> file handle
+    # Lines buffered per recipe type for the current batch; each file is appended once per batch
+    by_type_pending = defaultdict(list)  # safe_type_name -> by_type lines
+    item_inputs_pending = defaultdict(list)  # safe_type_name -> new input items
+    item_outputs_pending = defaultdict(list)  # safe_type_name -> new output items
+    item_inputs_written = defaultdict(set)  # safe_type_name -> items already written (for deduplication)
+    item_outputs_written = defaultdict(set)  # safe_type_name -> items already written (for deduplication)
+    safe_type_names = {}  # recipe_type -> sanitized file name (computed once per type)
     
-    # Process mods in batches to prevent too many open files
+    # Process mods in batches so buffered output is written out regularly
     mods_list = list(mods.items())
     total_mods = len(mods_list)
     
@@ -159,23 +194,25 @@ def discover_and_save_recipes_incremental(mods, output_dir):
             print(f"Scanning recipes: {mod_id}...", end=' ', flush=True)
             
             mod_recipe_count = 0
-            mod_recipes = []
+            mod_recipe_ids = []  # Only the IDs are needed for by_mod; don't retain parsed recipes
             
             with open_jar_safe(jar_path) as jar:
-                file_list = jar.namelist()
-                
-                for file_path in file_list:
-                    if '/recipes/' in file_path and file_path.endswith('.json'):
-                        parts = file_path.split('/')
+                # infolist() returns the archive's own entry list; namelist() would build a copy
+                for entry in jar.infolist():
+                    file_path = entry.filename
+                    # Cheap prefix test first: most entries are classes or assets
+                    if file_path.startswith('data/') and '/recipes/' in file_path and file_path.endswith('.json'):
+                        # Bounded split: only the namespace and the depth check need the segments
+                        parts = file_path.split('/', 3)
                         if len(parts) >= 4:
                             namespace = parts[1]
-                            recipe_name = parts[-1].replace('.json', '')
+                            recipe_name = file_path.rpartition('/')[2][:-5]  # Strip '.json' (suffix checked above)
                             recipe_id = f"{namespace}:{recipe_name}"
                             
                             recipe_data = load_json_from_jar(jar, file_path)
                             if recipe_data:
                                 recipe_info = parse_recipe(recipe_data, recipe_id)
-                                mod_recipes.append(recipe_info)
+                                mod_recipe_ids.append(recipe_id)
                                 mod_recipe_count += 1
                                 
                                 # Track recipe type
@@ -184,80 +221,51 @@ def discover_and_save_recipes_incremental(mods, output_dir):
                                     recipe_types_found.add(recipe_type)
                                     recipe_counts_by_type[recipe_type] += 1
                                     
-                                    safe_type_name = sanitize_filename(recipe_type)
+                                    safe_type_name = safe_type_names.get(recipe_type)
+                                    if safe_type_name is None:
+                                        safe_type_name = safe_type_names[recipe_type] = sanitize_filename(recipe_type)
                                     
-                                    # Get or create file handle for by_type (reopen in append mode if needed)
-                                    if safe_type_name not in by_type_files:
-                                        type_file = by_type_dir / f"{safe_type_name}.txt"
-                                        by_type_files[safe_type_name] = open(type_file, 'a', encoding='utf-8')
+                                    # Sort once; by_type and the item files below both need sorted order
+                                    sorted_inputs = sorted(recipe_info['inputs'])
+                                    sorted_outputs = sorted(recipe_info['outputs'])
                                     
-                                    by_type_files[safe_type_name].write(f"{recipe_info['id']}\n")
-                                    if recipe_info['inputs']:
-                                        by_type_files[safe_type_name].write(f"  Inputs: {', '.join(sorted(recipe_info['inputs']))}\n")
-                                    if recipe_info['outputs']:
-                                        by_type_files[safe_type_name].write(f"  Outputs: {', '.join(sorted(recipe_info['outputs']))}\n")
-                                    by_type_files[safe_type_name].write("\n")
+                                    type_lines = by_type_pending[safe_type_name]
+                                    type_lines.append(f"{recipe_info['id']}\n")
+                                    if sorted_inputs:
+                                        type_lines.append(f"  Inputs: {', '.join(sorted_inputs)}\n")
+                                    if sorted_outputs:
+                                        type_lines.append(f"  Outputs: {', '.join(sorted_outputs)}\n")
+                                    type_lines.append("\n")
                                     
-                                    # Get or create file handles for item inputs/outputs (reopen in append mode if needed)
-                                    if safe_type_name not in item_inputs_files:
-                                        inputs_file = item_inputs_dir / f"{safe_type_name}.txt"
-                                        item_inputs_files[safe_type_name] = open(inputs_file, 'a', encoding='utf-8')
+                                    # Buffer item inputs (deduplicated per recipe type)
+                                    inputs_written = item_inputs_written[safe_type_name]
+                                    new_inputs = [item for item in sorted_inputs if item not in inputs_written]
+                                    item_inputs_pending[safe_type_name].extend(f"{item}\n" for item in new_inputs)
+                                    inputs_written.update(new_inputs)
                                     
-                                    if safe_type_name not in item_outputs_files:
-                                        outputs_file = item_outputs_dir / f"{safe_type_name}.txt"
-                                        item_outputs_files[safe_type_name] = open(outputs_file, 'a', encoding='utf-8')
-                                    
-                                    # Write item inputs
-                                    for item in sorted(recipe_info['inputs']):
-                                        item_inputs_files[safe_type_name].write(f"{item}\n")
-                                    
-                                    # Write item outputs
-                                    for item in sorted(recipe_info['outputs']):
-                                        item_outputs_files[safe_type_name].write(f"{item}\n")
+                                    # Buffer item outputs (deduplicated per recipe type)
+                                    outputs_written = item_outputs_written[safe_type_name]
+                                    new_outputs = [item for item in sorted_outputs if item not in outputs_written]
+                                    item_outputs_pending[safe_type_name].extend(f"{item}\n" for item in new_outputs)
+                                    outputs_written.update(new_outputs)
                 
                 # Write mod recipes file
-                if mod_recipes:
+                if mod_recipe_ids:
                     mod_file = by_mod_dir / f"{mod_id}.txt"
                     with open(mod_file, 'w', encoding='utf-8') as f:
-                        for recipe in sorted(mod_recipes, key=lambda x: x['id']):
-                            f.write(f"{recipe['id']}\n")
+                        f.writelines([f"{recipe_id}\n" for recipe_id in sorted(mod_recipe_ids)])
                     
-                    recipe_counts_by_mod[mod_id] = len(mod_recipes)
-                    total_recipes += len(mod_recipes)
+                    recipe_counts_by_mod[mod_id] = len(mod_recipe_ids)
+                    total_recipes += len(mod_recipe_ids)
             
             print(f"Found {mod_recipe_count} recipes")
         
-        # After each batch: flush and close all file handles
-        logger.info(f"Flushing and closing all recipe files after batch {batch_num}...")
-        for f in by_type_files.values():
-            f.flush()
-            f.close()
-        for f in item_inputs_files.values():
-            f.flush()
-            f.close()
-        for f in item_outputs_files.values():
-            f.flush()
-            f.close()
-        
-        # Clear file handles (will be reopened in append mode if needed in next batch)
-        by_type_files.clear()
-        item_inputs_files.clear()
-        item_outputs_files.clear()
-    
-    # Final flush and close (in case any files are still open)
-    logger.info("Final flush and close of all recipe files...")
-    for f in by_type_files.values():
-        f.flush()
-        f.close()
-    for f in item_inputs_files.values():
-        f.flush()
-        f.close()
-    for f in item_outputs_files.values():
-        f.flush()
-        f.close()
-    by_type_files.clear()
-    item_inputs_files.clear()
-    item_outputs_files.clear()
+        # After each batch: append the buffered lines, one open per file
+        logger.info(f"Writing recipe files after batch {batch_num}...")
+        _append_pending_lines(by_type_pending, by_type_dir)
+        _append_pending_lines(item_inputs_pending, item_inputs_dir)
+        _append_pending_lines(item_outputs_pending, item_outputs_dir)
+        # Note: Keep item_inputs_written/item_outputs_written to prevent duplicates across batches
     
     from core.utils.format import print_subseparator
     print_subseparator()
@@ -13,7 +13,7 @@ from core.utils.item import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
-# Batch size for processing mods to prevent too many open files
+# Batch size for processing mods; buffered output is written to disk after each batch
 BATCH_SIZE = 64
 
 
@@ -71,10 +71,26 @@ def _is_namespace_installed(namespace, mods, namespace_to_mod_map):
 def _extract_namespace_from_item(item):
     """Extract namespace from an item identifier (e.g., 'minecraft:oak_door' -> 'minecraft')."""
     if ':' in item:
-        return item.split(':', 1)[0]
+        return item.partition(':')[0]
     return None
 
 
+def _flush_item_to_tags(pending, installed_dir, not_installed_dir):
+    """
+    Append buffered item_to_tags lines to disk and clear the buffer.
+    
+    Args:
+        pending: Dict of (safe_item_name, is_installed) -> list of lines to append
+        installed_dir: item_to_tags directory for installed namespaces
+        not_installed_dir: item_to_tags directory for not-installed namespaces
+    """
+    for (safe_item_name, item_is_installed), lines in pending.items():
+        item_tags_dir = installed_dir if item_is_installed else not_installed_dir
+        with open(item_tags_dir / f"{safe_item_name}.txt", 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+    pending.clear()
+
+
 def discover_and_save_tags_incremental(mods, output_dir, namespace_to_mod_map=None):
     """
     Discover tags incrementally and write to disk immediately.
@@ -113,10 +129,13 @@ def discover_and_save_tags_incremental(mods, output_dir, namespace_to_mod_map=No
     tag_type_dirs = {}  # tag_type -> Path
     tag_counts = defaultdict(int)  # tag_type -> count
     all_tag_names = set()  # Just tag names for later processing
-    item_to_tags_files = {}  # item -> file handle (kept open for current batch)
+    item_to_tags_pending = defaultdict(list)  # item_key -> tag lines buffered for the current batch
     item_to_tags_written = defaultdict(set)  # safe_item_name -> set of written tag strings (for deduplication)
+    # clean_item -> (safe_item_name, is_installed); the same items recur across many tags and JARs,
+    # so sanitizing and the namespace lookup are done once per item for this run
+    item_key_cache = {}
     
-    # Process mods in batches to prevent too many open files
+    # Process mods in batches so buffered output is written out regularly
     mods_list = list(mods.items())
     total_mods = len(mods_list)
     
@@ -133,10 +152,11 @@ def discover_and_save_tags_incremental(mods, output_dir, namespace_to_mod_map=No
             
             mod_tag_count = 0
             with open_jar_safe(jar_path) as jar:
-                file_list = jar.namelist()
-                
-                for file_path in file_list:
-                    if '/tags/' in file_path and file_path.endswith('.json'):
+                # infolist() returns the archive's own entry list; namelist() would build a copy
+                for entry in jar.infolist():
+                    file_path = entry.filename
+                    # Cheap prefix test first: most entries are classes or assets
+                    if file_path.startswith('data/') and '/tags/' in file_path and file_path.endswith('.json'):
                         parts = file_path.split('/')
                         
                         try:
@@ -144,7 +164,7 @@ def discover_and_save_tags_incremental(mods, output_dir, namespace_to_mod_map=No
                             if tags_index + 2 < len(parts):
                                 namespace = parts[tags_index - 1]
                                 tag_type = parts[tags_index + 1]
-                                tag_name = parts[-1].replace('.json', '')
+                                tag_name = parts[-1][:-5]  # Strip '.json' (suffix checked above)
                                 full_tag_name = f"{namespace}:{tag_name}"
                                 
                                 # Create tag type directory if needed
@@ -162,81 +182,66 @@ def discover_and_save_tags_incremental(mods, output_dir, namespace_to_mod_map=No
                                         values = tag_data
                                     
                                     # Write tag file immediately
+                                    # (the sanitized name is shared by tags/ and tag_to_items/)
                                     safe_tag_name = sanitize_filename(full_tag_name)
                                     tag_file = tag_type_dirs[tag_type] / f"{safe_tag_name}.txt"
                                     
-                                    tag_items = set()
+                                    # Dedup at write time: each item is written once, in first-seen
+                                    # order, so readers of tags/ never need a dedup pass.
+                                    # dict.fromkeys keeps that order in one C-level pass.
+                                    tag_items = dict.fromkeys(
+                                        item for value in values for item in extract_tag_value(value) if item
+                                    )
                                     with open(tag_file, 'w', encoding='utf-8') as f:
-                                        for value in values:
-                                            extracted = extract_tag_value(value)
-                                            for item in extracted:
-                                                if item:
-                                                    f.write(f"{item}\n")
-                                                    tag_items.add(item)
+                                        f.writelines(f"{item}\n" for item in tag_items)
                                     
                                     # Write tag_to_items file immediately (separated by installed/not_installed)
-                                    safe_tag_name_items = sanitize_filename(full_tag_name)
                                     # Determine if tag namespace is installed
                                     tag_is_installed = _is_namespace_installed(namespace, mods, namespace_to_mod_map)
                                     tag_items_dir = tag_to_items_installed_dir if tag_is_installed else tag_to_items_not_installed_dir
-                                    tag_items_file = tag_items_dir / f"{safe_tag_name_items}.txt"
+                                    tag_items_file = tag_items_dir / f"{safe_tag_name}.txt"
                                     with open(tag_items_file, 'w', encoding='utf-8') as f:
                                         # Write tag name as first line for reference
                                         f.write(f"#TAG:{full_tag_name}\n")
-                                        for item in sorted(tag_items):
-                                            f.write(f"{item}\n")
+                                        f.writelines([f"{item}\n" for item in sorted(tag_items)])
                                     
-                                    # Track item_to_tags (write incrementally with cached file handles)
+                                    # Track item_to_tags in item_to_tags_pending (flushed to disk after each batch)
                                     # Separated by installed/not_installed based on item namespace
                                     tag_entry = f"{tag_type}: {full_tag_name}"
                                     for item in tag_items:
                                         clean_item = item.lstrip('#')
                                         if clean_item:
-                                            safe_item_name = sanitize_filename(clean_item)
-                                            
-                                            # Extract namespace from item to determine if installed
-                                            item_namespace = _extract_namespace_from_item(clean_item)
-                                            item_is_installed = _is_namespace_installed(item_namespace, mods, namespace_to_mod_map) if item_namespace else False
-                                            
-                                            # Use a composite key that includes installed status
-                                            item_key = (safe_item_name, item_is_installed)
+                                            item_key = item_key_cache.get(clean_item)
+                                            if item_key is None:
+                                                safe_item_name = sanitize_filename(clean_item)
+                                                
+                                                # Extract namespace from item to determine if installed
+                                                item_namespace = _extract_namespace_from_item(clean_item)
+                                                item_is_installed = _is_namespace_installed(item_namespace, mods, namespace_to_mod_map) if item_namespace else False
+                                                
+                                                # Use a composite key that includes installed status
+                                                item_key = (safe_item_name, item_is_installed)
+                                                item_key_cache[clean_item] = item_key
                                             
                                             # Deduplication: check if this tag was already written for this item
                                             if tag_entry not in item_to_tags_written[item_key]:
-                                                # Get or create file handle (reopen in append mode if needed)
-                                                if item_key not in item_to_tags_files:
-                                                    item_tags_dir = item_to_tags_installed_dir if item_is_installed else item_to_tags_not_installed_dir
-                                                    item_file_path = item_tags_dir / f"{safe_item_name}.txt"
-                                                    item_to_tags_files[item_key] = open(item_file_path, 'a', encoding='utf-8')
-                                                
-                                                item_to_tags_files[item_key].write(f"{tag_entry}\n")
+                                                # Buffer the line; each item file is written once per batch
+                                                item_to_tags_pending[item_key].append(f"{tag_entry}\n")
                                                 item_to_tags_written[item_key].add(tag_entry)
                                 
                                 all_tag_names.add(full_tag_name)
                                 mod_tag_count += 1
                                 tag_counts[tag_type] += 1
                         except (ValueError, IndexError) as e:
-                            logger.debug(f"Failed to parse tag path {file_path}: {e}")
+                            logger.debug("Failed to parse tag path %s: %s", file_path, e)
             
             print(f"Found {mod_tag_count} tag groups")
         
-        # After each batch: flush and close all file handles
-        logger.info(f"Flushing and closing all tag files after batch {batch_num}...")
-        for f in item_to_tags_files.values():
-            f.flush()
-            f.close()
-        
-        # Clear file handles (will be reopened in append mode if needed in next batch)
-        item_to_tags_files.clear()
+        # After each batch: append the buffered lines, one open per item file
+        logger.info(f"Writing item tag files after batch {batch_num}...")
+        _flush_item_to_tags(item_to_tags_pending, item_to_tags_installed_dir, item_to_tags_not_installed_dir)
         # Note: Keep item_to_tags_written to prevent duplicates across batches
     
-    # Final flush and close (in case any files are still open)
-    logger.info("Final flush and close of all tag files...")
-    for f in item_to_tags_files.values():
-        f.flush()
-        f.close()
-    item_to_tags_files.clear()
-    
     total_tag_groups = sum(tag_counts.values())
     from core.utils.format import print_subseparator
     print_subseparator()
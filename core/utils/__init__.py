@@ -2,8 +2,8 @@
 Shared utilities for JAR, JSON, file, and item operations.
 """
 
-from core.utils.jar import open_jar_safe, extract_namespaces_from_jar
-from core.utils.json import load_json_from_jar, safe_json_load
+from core.utils.jar import open_jar_safe, extract_namespaces_from_jar, extract_namespaces_from_names
+from core.utils.json import load_json_from_jar, safe_json_load, dumps_json
 from core.utils.item import (
     extract_namespace,
     get_base_name,
@@ -13,16 +13,20 @@ from core.utils.item import (
 )
 from core.utils.file import (
     read_item_lines,
-    read_items_from_file
+    read_items_from_file,
+    write_sorted_lines,
+    find_txt_files
 )
 
 __all__ = [
     # JAR utilities
     'open_jar_safe',
     'extract_namespaces_from_jar',
+    'extract_namespaces_from_names',
     # JSON utilities
     'load_json_from_jar',
     'safe_json_load',
+    'dumps_json',
     # Item utilities
     'extract_namespace',
     'get_base_name',
@@ -32,4 +36,6 @@ __all__ = [
     # File utilities
     'read_item_lines',
     'read_items_from_file',
+    'write_sorted_lines',
+    'find_txt_files',
 ]
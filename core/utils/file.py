@@ -1,13 +1,15 @@
 """
-Shared utilities for reading item files.
+Shared utilities for reading and writing item files.
 
 This module provides functions for reading Minecraft item identifiers from text files,
-with consistent handling of comments, tag references, and metadata.
+with consistent handling of comments, tag references, and metadata, and for writing
+sorted item lists back to disk.
 
 Used by both scanner and builder modules.
 """
 
-from typing import Iterator
+import os
+from typing import Iterable, Iterator, List
 from pathlib import Path
 from .item import is_tag_reference, is_valid_item_id
 
@@ -115,3 +117,59 @@ def read_items_from_file(
     
     return set(read_item_lines(file_path, skip_comments, skip_tag_refs, handle_metadata))
 
+
+def write_sorted_lines(file_path: Path, items: Iterable[str]) -> None:
+    """
+    Write unique items to a file, one per line, in sorted order.
+    
+    Items are deduplicated and sorted once, then written with a single
+    writelines() call instead of one write() per item.
+    
+    Args:
+        file_path: Path to the file to write (overwritten if it exists)
+        items: Item strings to write. Duplicates are removed.
+    
+    Examples:
+        >>> from pathlib import Path
+        >>> write_sorted_lines(Path('items.txt'), {'minecraft:stone', 'forge:iron_ingot'})
+        >>> # items.txt now contains:
+        >>> #   forge:iron_ingot
+        >>> #   minecraft:stone
+    """
+    # Callers mostly pass sets already; only copy into a new set when deduplication is needed
+    unique_items = items if isinstance(items, (set, frozenset)) else set(items)
+    lines = [f"{item}\n" for item in sorted(unique_items)]
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+def find_txt_files(directory: Path) -> List[Path]:
+    """
+    List the .txt files directly inside a directory (non-recursive).
+    
+    Uses os.scandir(), whose entries carry the file type from the directory
+    listing, so no extra stat() call is made per entry as with Path.glob().
+    The extension is matched with the platform's case rules, as Path.glob()
+    does: case-insensitively on Windows, case-sensitively elsewhere.
+    
+    Args:
+        directory: Directory to list
+    
+    Returns:
+        List of paths to regular .txt files, in directory order.
+        Empty list if the directory doesn't exist or cannot be read.
+    
+    Examples:
+        >>> from pathlib import Path
+        >>> find_txt_files(Path('scan_output/items/installed'))
+        [PosixPath('scan_output/items/installed/create.txt'), ...]
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if os.path.normcase(entry.name).endswith('.txt') and entry.is_file()
+            ]
+    except OSError:
+        return []
@@ -8,6 +8,10 @@ Used by both scanner and builder modules.
 """
 
 
+# Character mapping for sanitize_filename, applied in a single str.translate pass
+_FILENAME_TRANSLATION = str.maketrans({':': '_', '/': '_', '#': 'tag_'})
+
+
 def extract_namespace(item_id: str) -> str | None:
     """
     Extract namespace from an item ID.
@@ -31,7 +35,7 @@ def extract_namespace(item_id: str) -> str | None:
     
     # Remove tag prefix if present
     clean_id = item_id.lstrip('#')
-    return clean_id.split(':', 1)[0]
+    return clean_id.partition(':')[0]
 
 
 def get_base_name(item_id: str, is_fluid: bool = False) -> str:
@@ -56,7 +60,7 @@ def get_base_name(item_id: str, is_fluid: bool = False) -> str:
     if ':' not in item_id:
         return item_id
     
-    base = item_id.split(':', 1)[1]
+    base = item_id.partition(':')[2]
     
     # For fluids, normalize flowing_* to the base name
     if is_fluid and base.startswith('flowing_'):
@@ -126,5 +130,5 @@ def sanitize_filename(name: str) -> str:
         >>> sanitize_filename('mod/name')
         'mod_name'
     """
-    return name.replace(':', '_').replace('/', '_').replace('#', 'tag_')
+    return name.translate(_FILENAME_TRANSLATION)
 
@@ -8,7 +8,7 @@ import zipfile
 import logging
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +32,16 @@ def open_jar_safe(jar_path: Path | str) -> Iterator[zipfile.ZipFile]:
         with zipfile.ZipFile(jar_path, 'r') as jar:
             yield jar
     except (zipfile.BadZipFile, OSError) as e:
-        logger.debug(f"Failed to open JAR {jar_path}: {e}")
+        logger.debug("Failed to open JAR %s: %s", jar_path, e)
         # Yield a dummy object that won't cause errors
         class DummyZipFile:
+            NameToInfo = {}
+            
             def namelist(self):
                 return []
+            
+            def infolist(self):
+                return []
         yield DummyZipFile()
 
 
@@ -50,17 +55,36 @@ def extract_namespaces_from_jar(jar_path: Path | str) -> set[str]:
     Returns:
         Set of namespace strings found in data/ directory
     """
-    namespaces = set()
     try:
         with zipfile.ZipFile(jar_path, 'r') as jar:
-            for file_path in jar.namelist():
-                if file_path.startswith('data/') and '/' in file_path[5:]:
-                    parts = file_path.split('/')
-                    if len(parts) >= 2:
-                        namespace = parts[1]
-                        namespaces.add(namespace)
+            return extract_namespaces_from_names(entry.filename for entry in jar.infolist())
     except (zipfile.BadZipFile, OSError) as e:
-        logger.debug(f"Failed to extract namespaces from JAR {jar_path}: {e}")
+        logger.debug("Failed to extract namespaces from JAR %s: %s", jar_path, e)
+    
+    return set()
+
+
+def extract_namespaces_from_names(file_names: Iterable[str]) -> set[str]:
+    """
+    Extract all namespaces from the data/ directory given a JAR's entry names.
+    
+    Lets callers that already hold a JAR's entry list reuse it instead of
+    reopening the archive.
+    
+    Args:
+        file_names: Entry names, e.g. from ZipFile.namelist()
+    
+    Returns:
+        Set of namespace strings found in data/ directory
+    """
+    namespaces = set()
+    for file_path in file_names:
+        if file_path.startswith('data/') and '/' in file_path[5:]:
+            # Only the namespace segment is needed, so stop splitting after it
+            parts = file_path.split('/', 2)
+            if len(parts) >= 2:
+                namespace = parts[1]
+                namespaces.add(namespace)
     
     return namespaces
 
@@ -4,12 +4,55 @@ JSON Utilities
 Common functions for JSON parsing with error handling.
 """
 
+import codecs
 import json
 import logging
 
+try:
+    import orjson  # Optional: faster parsing/serialization when installed
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _loads(content):
+    """
+    Parse JSON from bytes or str, using orjson when it is available.
+    
+    orjson is stricter than the stdlib parser (no BOM, UTF-8 only, no NaN,
+    64-bit integers), so anything it rejects is re-parsed with json.loads and
+    the accepted input stays exactly what the stdlib accepts.
+    """
+    if orjson is not None:
+        if isinstance(content, bytes) and content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def dumps_json(data) -> str:
+    """
+    Serialize data to a JSON string indented by 2 spaces.
+    
+    Uses orjson when available. Either way the layout matches
+    json.dumps(data, indent=2, ensure_ascii=False), so non-ASCII characters
+    are written as UTF-8 whether or not orjson is installed.
+    
+    Args:
+        data: JSON-serializable data
+    
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def load_json_from_jar(jar, file_path: str, default=None):
     """
     Load and parse JSON from a JAR file.
@@ -23,11 +66,11 @@ def load_json_from_jar(jar, file_path: str, default=None):
         Parsed JSON data or default value on error
     """
     try:
-        with jar.open(file_path) as f:
-            content = f.read().decode('utf-8')
-            return json.loads(content)
+        # Read the entry in one call and let json.loads detect the encoding from the bytes
+        return _loads(jar.read(file_path))
     except (json.JSONDecodeError, UnicodeDecodeError, KeyError) as e:
-        logger.debug(f"Failed to load JSON from {file_path}: {e}")
+        # Lazy %-args: debug is off by default and this runs for every malformed entry
+        logger.debug("Failed to load JSON from %s: %s", file_path, e)
         return default
     except Exception as e:
         logger.warning(f"Unexpected error loading JSON from {file_path}: {e}")
@@ -46,9 +89,9 @@ def safe_json_load(content: str, default=None):
         Parsed JSON data or default value on error
     """
     try:
-        return json.loads(content)
+        return _loads(content)
     except json.JSONDecodeError as e:
-        logger.debug(f"Failed to parse JSON: {e}")
+        logger.debug("Failed to parse JSON: %s", e)
         return default
     except Exception as e:
         logger.warning(f"Unexpected error parsing JSON: {e}")
@@ -24,32 +24,33 @@ def validate_directory(
     Returns:
         True if path is a valid directory, False otherwise
     """
-    if not path.exists():
-        if create:
-            try:
-                path.mkdir(parents=True, exist_ok=True)
-                return True
-            except OSError as e:
-                if error_on_fail:
-                    log_error(f"Failed to create directory {path}: {e}")
-                else:
-                    log_warning(f"Failed to create directory {path}: {e}")
-                return False
-        else:
-            if error_on_fail:
-                log_error(f"Directory does not exist: {path}")
-            else:
-                log_warning(f"Directory does not exist: {path}")
-            return False
+    # Common case first: an existing directory needs a single stat call
+    if path.is_dir():
+        return True
     
-    if not path.is_dir():
+    if path.exists():
         if error_on_fail:
             log_error(f"Path is not a directory: {path}")
         else:
             log_warning(f"Path is not a directory: {path}")
         return False
     
-    return True
+    if create:
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            return True
+        except OSError as e:
+            if error_on_fail:
+                log_error(f"Failed to create directory {path}: {e}")
+            else:
+                log_warning(f"Failed to create directory {path}: {e}")
+            return False
+    
+    if error_on_fail:
+        log_error(f"Directory does not exist: {path}")
+    else:
+        log_warning(f"Directory does not exist: {path}")
+    return False
 
 
 def validate_file(
@@ -66,19 +67,19 @@ def validate_file(
     Returns:
         True if path is a valid file, False otherwise
     """
-    if not path.exists():
-        if error_on_fail:
-            log_error(f"File does not exist: {path}")
-        else:
-            log_warning(f"File does not exist: {path}")
-        return False
+    # Common case first: an existing file needs a single stat call
+    if path.is_file():
+        return True
     
-    if not path.is_file():
+    if path.exists():
         if error_on_fail:
             log_error(f"Path is not a file: {path}")
         else:
             log_warning(f"Path is not a file: {path}")
         return False
     
-    return True
-
+    if error_on_fail:
+        log_error(f"File does not exist: {path}")
+    else:
+        log_warning(f"File does not exist: {path}")
+    return False
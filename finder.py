@@ -11,7 +11,7 @@ from pathlib import Path
 
 from core import DatapackType, DATAPACK_CONFIGS
 from core.builder.models import TYPE_NAME_MAP
-from core.builder.processors import FileParser, ItemGrouper
+from core.builder.processors import FileParser
 from core.finder import PairScanner, save_pairs, save_summary, copy_scan_files
 from core.constants import DefaultDirs, DisplayConstants
 from core.utils.cli import determine_datapack_types
@@ -90,8 +90,7 @@ Examples:
     
     # Initialize processors
     file_parser = FileParser()
-    item_grouper = ItemGrouper()
-    pair_scanner = PairScanner(file_parser, item_grouper)
+    pair_scanner = PairScanner(file_parser)
     
     # Create output directory
     if not validate_directory(args.output, create=True, error_on_fail=True):
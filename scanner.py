@@ -54,9 +54,6 @@ Examples:
     if not validate_directory(args.mods_dir, error_on_fail=True):
         log_error("Please specify a valid directory with -m/--mods-dir", exit_code=1)
     
-    if not args.mods_dir.is_dir():
-        log_error(f"Path is not a directory: {args.mods_dir}", exit_code=1)
-    
     # Run the scan
     try:
         scan(str(args.mods_dir), str(args.output_dir))